@@ -1,17 +1,35 @@
+from __future__ import annotations
+
 import os
+import re
 import json
+import math
+import string
+import threading
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from difflib import SequenceMatcher  # needed for best_faq_match
 from urllib.parse import quote_plus  # for building search URLs
 import streamlit as st
 
-# Optional OpenAI import
+# Optional RapidFuzz import (fast C++ fuzzy matching for the FAQ search)
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    fuzz = None
+    process = None
+    default_process = None
+    RAPIDFUZZ_AVAILABLE = False
+
+# Optional orjson import (faster JSON parsing in load_json)
 try:
-    import openai
-    OPENAI_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    openai = None
-    OPENAI_AVAILABLE = False
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 # ✅ FIRST and ONLY Streamlit page config call
 st.set_page_config(
@@ -26,65 +44,284 @@ st.set_page_config(
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
+ASSETS_DIR = BASE_DIR / "assets"
 
 
-@st.cache_data
+# Shared across sessions without copying: callers must treat the data as read-only
+@st.cache_resource(show_spinner=False)
 def load_json(filename: str):
     path = DATA_DIR / filename
     if not path.exists():
         return []
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-faqs = load_json("faqs.json")
-cities = load_json("cities.json")
-guides = load_json("immigration_guides.json")
+@st.cache_data
+def load_css(filename: str) -> str:
+    path = ASSETS_DIR / filename
+    if not path.exists():
+        return ""
+    return path.read_text(encoding="utf-8")
+
+
+# Data is loaded on demand by the pages that need it (About loads none)
+def get_faqs():
+    return load_json("faqs.json")
+
+
+def get_cities():
+    return load_json("cities.json")
+
+
+def get_guides():
+    return load_json("immigration_guides.json")
+
+
+_WORD_RE = re.compile(r"\w+")
+_WS_RE = re.compile(r"\s+")
+_PUNCT_TBL = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, turn ASCII punctuation into spaces and collapse whitespace."""
+    return _WS_RE.sub(" ", text.lower().translate(_PUNCT_TBL)).strip()
+
+
+def _tokenize(text: str) -> set:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def _build_token_index(items: list) -> dict:
+    """Map each question/tag token to the indices of the FAQs containing it."""
+    index = {}
+    for i, faq in enumerate(items):
+        text = " ".join([faq.get("question", "")] + list(faq.get("tags", [])))
+        for tok in _tokenize(text):
+            index.setdefault(tok, []).append(i)
+    return index
+
+
+def _sorted_tokens(text: str) -> str:
+    """Words of the text in sorted order, so word order doesn't change scores."""
+    return " ".join(sorted(_WORD_RE.findall(text.lower())))
+
+
+@st.cache_resource
+def _faq_lookup():
+    """
+    FAQ lookups built once per process (read-only): normalized question ->
+    index for the exact-match fast path (first one wins), token -> FAQ
+    indices, and the word-sorted questions used by the difflib fallback.
+    """
+    faqs = get_faqs()
+    by_question = {}
+    for i, faq in enumerate(faqs):
+        by_question.setdefault(_normalize(faq.get("question", "")), i)
+    sorted_questions = [_sorted_tokens(f.get("question", "")) for f in faqs]
+    return by_question, _build_token_index(faqs), sorted_questions
+
+
+@st.cache_resource
+def _faq_index():
+    """
+    FAQ questions normalized once with RapidFuzz's default_process.
+    Shared across sessions: treat the returned list as read-only.
+    """
+    return [default_process(f.get("question", "")) for f in get_faqs()]
+
+
+def _terms(text: str) -> list:
+    """Word unigrams and bigrams used by the TF-IDF index."""
+    words = _WORD_RE.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+@st.cache_resource
+def _tfidf_index():
+    """
+    Sparse TF-IDF index over the FAQ questions: (idf, postings), where
+    postings maps each term to [(faq_index, l2_normalized_weight), ...].
+    Shared across sessions: treat the returned objects as read-only.
+    """
+    docs = [Counter(_terms(f.get("question", ""))) for f in get_faqs()]
+    df = Counter(t for doc in docs for t in doc)
+    idf = {t: math.log((1 + len(docs)) / (1 + n)) + 1.0 for t, n in df.items()}
+
+    postings = {}
+    for i, doc in enumerate(docs):
+        weights = {t: tf * idf[t] for t, tf in doc.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        for t, w in weights.items():
+            postings.setdefault(t, []).append((i, w / norm))
+    return idf, postings
+
+
+def _tfidf_best(q_lc: str):
+    """Return (faq_index or None, cosine similarity) of the closest FAQ."""
+    idf, postings = _tfidf_index()
+    q_weights = {t: tf * idf[t] for t, tf in Counter(_terms(q_lc)).items() if t in idf}
+    if not q_weights:
+        return None, 0.0
+    q_norm = math.sqrt(sum(w * w for w in q_weights.values()))
+
+    scores = {}
+    for t, q_w in q_weights.items():
+        for i, w in postings[t]:
+            scores[i] = scores.get(i, 0.0) + q_w * w
+    best = max(scores, key=scores.get)
+    return best, scores[best] / q_norm
+
+
+@st.cache_resource
+def _city_indices():
+    """
+    City lookups for the Explore page, built once per process (read-only):
+    province -> city indices, the set of family-friendly city indices and
+    the region_label column.
+    """
+    by_province = {}
+    family = set()
+    cities = get_cities()
+    for i, c in enumerate(cities):
+        by_province.setdefault(c.get("province"), []).append(i)
+        if c.get("family_friendly", False):
+            family.add(i)
+    regions = tuple(c.get("region_label") for c in cities)
+    return by_province, frozenset(family), regions
+
+
+@st.cache_resource
+def _guide_index():
+    """
+    Topic -> guide (first match wins, as before) and the ordered topic list,
+    built once per process (read-only).
+    """
+    guides = get_guides()
+    by_topic = {}
+    for g in guides:
+        by_topic.setdefault(g.get("topic"), g)
+    return by_topic, tuple(g.get("topic") for g in guides)
 
 
 # =========================================================
 # Helper functions
 # =========================================================
 
-def best_faq_match(query: str, threshold: float = 0.55):
+@lru_cache(maxsize=1)
+def _sequence_matcher_cls():
     """
-    Find the FAQ question with highest similarity to the query.
-    Returns (faq_dict or None, similarity_score).
+    Import SequenceMatcher on first use in a run, so pages that never match
+    FAQs skip it. Prefers cydifflib's native build (same API as difflib) when
+    installed.
     """
-    query = (query or "").strip()
-    if not query or not faqs:
-        return None, 0.0
+    try:
+        from cydifflib import SequenceMatcher
+    except ImportError:
+        from difflib import SequenceMatcher
+    return SequenceMatcher
 
+
+@st.cache_data(max_entries=512, ttl="1h", show_spinner=False)
+def _best_faq_index(q_lc: str, threshold: float):
+    """
+    Cached core of best_faq_match, keyed on the normalized query.
+    Returns (faq_index or None, similarity_score).
+    """
+    by_question, token_index, sorted_questions = _faq_lookup()
+
+    # Identical question: skip the fuzzy matcher entirely
+    hit = by_question.get(q_lc)
+    if hit is not None:
+        return hit, 1.0
+
+    # Layered scoring: TF-IDF cosine first (handles paraphrases), then fuzzy
+    idx, score = _tfidf_best(q_lc)
+    if idx is not None and score >= threshold:
+        return idx, score
+
+    # Only score FAQs sharing a token with the query (full scan if none do)
+    candidates = sorted(
+        {i for tok in _tokenize(q_lc) for i in token_index.get(tok, ())}
+    ) or range(len(sorted_questions))
+
+    if RAPIDFUZZ_AVAILABLE:
+        choices = _faq_index()
+        match = process.extractOne(
+            default_process(q_lc),
+            {i: choices[i] for i in candidates},
+            scorer=fuzz.token_sort_ratio,
+            score_cutoff=threshold * 100,
+        )
+        if match is None:
+            return None, 0.0
+        _, score, idx = match
+        return idx, score / 100.0
+
+    # Fallback: pure-Python difflib matching on token-sorted text
+    # (the same measure as RapidFuzz's token_sort_ratio above)
     best = None
     best_score = 0.0
 
-    for faq in faqs:
-        q_text = faq.get("question", "")
-        score = SequenceMatcher(None, query.lower(), q_text.lower()).ratio()
+    # difflib caches its index (b2j) and char counts for seq2, so the query
+    # goes there once and only seq1 changes per candidate
+    sm = _sequence_matcher_cls()(None, autojunk=False)
+    sm.set_seq2(_sorted_tokens(q_lc))
+    for i in candidates:
+        sm.set_seq1(sorted_questions[i])
+        # Cheap upper bounds on ratio() (length, then character bag): skip
+        # FAQs that cannot reach the threshold or beat the current best
+        bound = sm.real_quick_ratio()
+        if bound < threshold or bound <= best_score:
+            continue
+        bound = sm.quick_ratio()
+        if bound < threshold or bound <= best_score:
+            continue
+        score = sm.ratio()
         if score > best_score:
             best_score = score
-            best = faq
+            best = i
+            if score == 1.0:
+                break  # identical word sets, nothing can score higher
 
     if best_score < threshold:
         return None, best_score
     return best, best_score
 
 
+def best_faq_match(query: str, threshold: float = 0.55):
+    """
+    Find the FAQ question with highest similarity to the query.
+    Returns (faq_dict or None, similarity_score).
+    """
+    faqs = get_faqs()
+    q_lc = _normalize(query or "")
+    if len(q_lc) < 3 or not faqs:
+        return None, 0.0
+
+    idx, score = _best_faq_index(q_lc, threshold)
+    return (faqs[idx] if idx is not None else None), score
+
+
+@st.cache_data
 def list_provinces():
+    cities = get_cities()
     if not cities:
         return []
     return sorted({c.get("province", "Unknown") for c in cities})
 
 
 def cities_in_province(province: str):
-    return [c for c in cities if c.get("province") == province]
+    by_province, _, _ = _city_indices()
+    cities = get_cities()
+    return [cities[i] for i in by_province.get(province, ())]
 
 
 def get_guide_by_topic(topic: str):
-    for g in guides:
-        if g.get("topic") == topic:
-            return g
-    return None
+    by_topic, _ = _guide_index()
+    return by_topic.get(topic)
 
 
 def maps_search_url(query: str) -> str:
@@ -97,9 +334,40 @@ def google_search_url(query: str) -> str:
     return f"https://www.google.com/search?q={quote_plus(query)}"
 
 
+def job_search_urls(job: str, city: str) -> tuple:
+    """(Indeed, Job Bank, LinkedIn) search URLs for a job title and city."""
+    job_q, city_q = quote_plus(job), quote_plus(city)
+    return (
+        f"https://ca.indeed.com/jobs?q={job_q}&l={city_q}",
+        "https://www.jobbank.gc.ca/jobsearch/jobsearch?"
+        f"searchstring={job_q}&locationstring={city_q}",
+        "https://www.linkedin.com/jobs/search/?"
+        f"keywords={job_q}&location={city_q}",
+    )
+
+
+@lru_cache(maxsize=1)
+def _openai_cls():
+    """
+    Import the optional OpenAI client (openai>=1.0) on first use, so cold
+    starts and pages that never call the AI skip it. None if not installed.
+    """
+    try:
+        from openai import OpenAI
+    except ImportError:
+        return None
+    return OpenAI
+
+
+@st.cache_resource
+def _openai_client(api_key: str):
+    """One shared client per key, so its HTTP connection pool is reused."""
+    return _openai_cls()(api_key=api_key)
+
+
 def get_openai_client():
     """Return configured OpenAI client or None if not available."""
-    if not OPENAI_AVAILABLE:
+    if _openai_cls() is None:
         return None
 
     api_key = None
@@ -116,15 +384,28 @@ def get_openai_client():
     if not api_key:
         return None
 
-    openai.api_key = api_key
-    return openai
+    return _openai_client(api_key)
+
+
+AI_ANSWER_CACHE_SIZE = 256
 
 
-def generate_ai_answer(user_question: str, faq: dict | None, lang_code: str):
+@st.cache_resource
+def _ai_answer_cache() -> tuple:
+    """
+    Finished AI answers keyed by (question, matched FAQ, language), oldest
+    first, plus the lock guarding writes. Both are shared by all sessions;
+    the lock lives here because module-level objects are rebuilt each rerun.
+    """
+    return {}, threading.Lock()
+
+
+def generate_ai_answer(user_question: str, faq: dict | None, lang_code: str, placeholder=None):
     """
     Call OpenAI (if available) to generate a tailored answer as
     'MyCanada Newcomer AI Assistant'. Returns (answer, error_message).
     lang_code: "en" or "am"
+    placeholder: optional st.empty() the answer is streamed into as it arrives
     """
     client = get_openai_client()
     if client is None:
@@ -133,6 +414,15 @@ def generate_ai_answer(user_question: str, faq: dict | None, lang_code: str):
             "Showing FAQ-based answer only."
         )
 
+    # Same question, FAQ and language as before: reuse the answer, skip the API
+    cache_key = (user_question.strip(), faq.get("question", "") if faq else "", lang_code)
+    answers, answers_lock = _ai_answer_cache()
+    answer = answers.get(cache_key)
+    if answer is not None:
+        if placeholder is not None:
+            placeholder.markdown(answer)
+        return answer, None
+
     ref_text = ""
     if faq:
         ref_text = (
@@ -166,20 +456,36 @@ def generate_ai_answer(user_question: str, faq: dict | None, lang_code: str):
     )
 
     try:
-        # Using ChatCompletion from openai~=0.x
-        response = client.ChatCompletion.create(
+        response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": system_msg},
                 {"role": "user", "content": user_msg},
             ],
             temperature=0.5,
+            stream=True,
         )
-        answer = response.choices[0].message["content"]
-        return answer, None
+        parts = []
+        for chunk in response:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                if placeholder is not None:
+                    placeholder.markdown("".join(parts))
+        answer = "".join(parts)
     except Exception as e:
+        if placeholder is not None:
+            placeholder.empty()
         return None, f"AI error: {e}"
 
+    # Outside the try: cache bookkeeping must never discard a finished answer
+    if answer:
+        with answers_lock:
+            answers[cache_key] = answer
+            if len(answers) > AI_ANSWER_CACHE_SIZE:
+                answers.pop(next(iter(answers), None), None)
+    return answer, None
+
 
 # =========================================================
 # Translation helpers (English <-> Amharic)
@@ -191,137 +497,23 @@ def tr(en: str, am: str) -> str:
     return am if lang == "am" else en
 
 
-def translate_dynamic(item: dict, key: str) -> str:
+def translate_dynamic(item: dict, key: str, lang: str | None = None) -> str:
     """
-    For content coming from JSON, try keys like 'summary_am'.
-    Fallback to the base key.
+    For content coming from JSON, try keys like 'summary_am' (any language
+    code works). Fallback to the base key. Defaults to the session language.
     """
-    lang = st.session_state.get("lang", "en")
+    lang = lang or st.session_state.get("lang", "en")
     if lang == "en":
         return item.get(key, "")
-    am_key = f"{key}_am"
-    return item.get(am_key, item.get(key, ""))
+    return item.get(f"{key}_{lang}", item.get(key, ""))
 
 
 # =========================================================
 # Streamlit UI – theming & layout
 # =========================================================
 
-# ---------- Custom CSS: improved contrast, font size, clean layout ----------
-st.markdown(
-    """
-    <style>
-    html, body, [class*="css"] {
-        font-family: "Segoe UI", -apple-system, BlinkMacSystemFont, "Roboto", sans-serif;
-    }
-
-    .stApp {
-        background: radial-gradient(circle at 0% 0%, #020617 0%, #020617 40%, #020617 100%);
-    }
-
-    .block-container {
-        padding-top: 1.5rem;
-        padding-bottom: 2rem;
-        background: linear-gradient(145deg, #fefce8 0%, #fffbeb 30%, #ecfdf5 65%, #e0f2fe 100%);
-        border-radius: 24px;
-        box-shadow: 0 22px 60px rgba(15, 23, 42, 0.55);
-        margin-top: 1.2rem;
-        margin-bottom: 2rem;
-        max-width: 1200px;
-    }
-
-    /* Centered big title banner */
-    .mc-hero {
-        border-radius: 24px;
-        padding: 1.4rem 1.8rem;
-        text-align: center;
-        background: radial-gradient(circle at top left, #fb923c 0%, #f97316 20%, #0284c7 85%);
-        color: white;
-        box-shadow: 0 18px 40px rgba(15, 23, 42, 0.7);
-        margin-bottom: 1.0rem;
-    }
-    .mc-hero h1 {
-        margin-bottom: 0.3rem;
-        font-size: 2.3rem;
-        letter-spacing: 0.03em;
-    }
-    .mc-hero p {
-        margin-top: 0;
-        font-size: 1.0rem;
-        line-height: 1.5;
-        opacity: 0.96;
-    }
-
-    /* Small pill tags */
-    .mc-pill {
-        display: inline-block;
-        padding: 0.12rem 0.8rem;
-        border-radius: 999px;
-        font-size: 0.78rem;
-        font-weight: 600;
-        background-color: rgba(15, 23, 42, 0.22);
-        color: #f9fafb;
-        margin: 0 0.18rem;
-    }
-
-    /* Sidebar styling - better contrast, larger fonts, cleaner layout */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #020617 0%, #020617 60%, #020617 100%) !important;
-        color: #f9fafb !important;
-        padding: 1.2rem 1rem !important;
-    }
-    [data-testid="stSidebar"] * {
-        color: #e5e7eb !important;
-        font-size: 1.0rem !important;
-    }
-    [data-testid="stSidebar"] h1,
-    [data-testid="stSidebar"] h2,
-    [data-testid="stSidebar"] h3 {
-        color: #facc15 !important;
-        margin-bottom: 0.4rem !important;
-    }
-    [data-testid="stSidebar"] label {
-        color: #e5e7eb !important;
-        font-weight: 500;
-    }
-    [data-testid="stSidebar"] .element-container {
-        padding-bottom: 0.35rem;
-    }
-
-    /* Cards */
-    .mc-card {
-        background-color: rgba(255, 255, 255, 0.9);
-        border-radius: 18px;
-        padding: 1rem 1.2rem;
-        box-shadow: 0 10px 30px rgba(15, 23, 42, 0.18);
-        margin-bottom: 0.9rem;
-    }
-
-    .mc-muted {
-        color: #4b5563;
-        font-size: 0.86rem;
-    }
-
-    .mc-chip {
-        display: inline-flex;
-        align-items: center;
-        padding: 0.15rem 0.6rem;
-        border-radius: 999px;
-        background-color: #fee2e2;
-        color: #b91c1c;
-        font-size: 0.78rem;
-        font-weight: 600;
-        margin-right: 0.3rem;
-        margin-bottom: 0.2rem;
-    }
-
-    h2, h3, h4 {
-        letter-spacing: 0.01em;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+# ---------- Custom CSS (assets/style.css): improved contrast, font size, clean layout ----------
+st.markdown(f"<style>{load_css('style.css')}</style>", unsafe_allow_html=True)
 
 # =========================================================
 # Sidebar – Language, navigation & filters
@@ -335,10 +527,6 @@ lang_label = st.sidebar.selectbox(
 lang_code = "am" if "Amharic" in lang_label else "en"
 st.session_state["lang"] = lang_code
 
-def tr(en: str, am: str) -> str:
-    """Re-declare to ensure it picks current lang_code in session."""
-    return am if lang_code == "am" else en
-
 st.sidebar.title(tr("MyCanada Controls", "MyCanada መቆጣጠሪያዎች"))
 
 # Page definitions (codes so we can translate labels safely)
@@ -401,7 +589,7 @@ PAGE_DEFS = [
 
 st.sidebar.subheader(tr("Mode", "ዘዴ"))
 
-page_index = st.sidebar.radio(
+page_index = st.sidebar.selectbox(
     tr("Choose what you want to explore:", "ምን መፈለግ ትፈልጋለህ?"),
     options=list(range(len(PAGE_DEFS))),
     format_func=lambda i: f"{PAGE_DEFS[i]['icon']} "
@@ -470,11 +658,12 @@ st.caption(
     )
 )
 
+
 # =========================================================
 # Page 1 – Ask the assistant (FAQ-style QA with AI)
 # =========================================================
 
-if page_code == "assistant":
+def render_assistant_page():
     if lang_code == "am":
         st.subheader("ከ MyCanada አዲስ መጡ ኤይአይ አጋዥ ጋር ጠይቅ")
         question_label = "ስለ ካናዳ መግባት ወይም መቀመጥ ጥያቄህን እዚህ ጻፍ፦"
@@ -491,11 +680,13 @@ if page_code == "assistant":
     col_q, col_info = st.columns([2, 1.2])
 
     with col_q:
-        user_question = st.text_input(
-            question_label,
-            placeholder=question_ph,
-        )
-        ask = st.button(ask_label)
+        # A form only reruns the script on submit, not on every edit
+        with st.form("ask_form"):
+            user_question = st.text_input(
+                question_label,
+                placeholder=question_ph,
+            )
+            ask = st.form_submit_button(ask_label)
 
     with col_info:
         if lang_code == "am":
@@ -530,9 +721,6 @@ if page_code == "assistant":
     if ask and user_question.strip():
         faq, score = best_faq_match(user_question)
 
-        # Try AI first
-        ai_answer, ai_error = generate_ai_answer(user_question, faq, lang_code)
-
         if lang_code == "am":
             st.markdown("### 🗣️ ጥያቄህ")
         else:
@@ -544,9 +732,11 @@ if page_code == "assistant":
         else:
             st.markdown("### 🤖 Assistant answer")
 
-        if ai_answer:
-            st.write(ai_answer)
-        else:
+        # Try AI first, streaming the answer in as it is generated
+        answer_slot = st.empty()
+        ai_answer, ai_error = generate_ai_answer(user_question, faq, lang_code, answer_slot)
+
+        if not ai_answer:
             # Fallback: FAQ only
             if ai_error:
                 st.info(ai_error)
@@ -580,9 +770,133 @@ if page_code == "assistant":
 # Page 2 – City & Province explorer
 # =========================================================
 
-elif page_code == "cities":
+CITIES_PER_PAGE = 20
+
+
+def _set_cities_page(page_idx: int):
+    st.session_state["cities_page"] = page_idx
+
+
+@st.cache_resource
+def _city_cards_html(lang: str) -> tuple:
+    """
+    Card HTML for every city in the given language, aligned with get_cities().
+    Cards don't depend on the filters, so each is rendered once per language.
+    """
+    def pick(en, am):
+        return am if lang == "am" else en
+
+    lbl_newcomer = pick("Newcomer services:", "የአዲስ መጡ አገልግሎቶች፦")
+    lbl_cost = pick("Cost of living:", "የኑሮ ወጪ፦")
+    lbl_transit = pick("Transit:", "ትራንስፖርት፦")
+
+    cards = []
+    for city in get_cities():
+        name = translate_dynamic(city, "name", lang) or city.get("name")
+        prov = city.get("province")
+        region_label = translate_dynamic(city, "region_label", lang)
+        summary = translate_dynamic(city, "summary", lang)
+        newcomers = translate_dynamic(city, "newcomer_support", lang)
+        key_sectors = city.get("key_sectors", [])
+        cost_level = city.get("cost_of_living", "Unknown")
+        transit = city.get("transit", "Unknown")
+
+        cards.append(
+            f"""
+            <div class="mc-card">
+                <h3 style="margin-bottom:0.1rem;">{name}, {prov}</h3>
+                <p class="mc-muted" style="margin-top:0.1rem;">{region_label}</p>
+                <p style="margin-top:0.4rem;">{summary}</p>
+                <p><strong>{lbl_newcomer}</strong> {newcomers}</p>
+                <p>
+                    <strong>{lbl_cost}</strong> {cost_level} &nbsp; • &nbsp;
+                    <strong>{lbl_transit}</strong> {transit}
+                </p>
+                <p>
+                    {"".join(f'<span class="mc-pill">{sec}</span>' for sec in key_sectors)}
+                </p>
+            </div>
+            """
+        )
+    return tuple(cards)
+
+
+def render_city_cards(province_choice, preferred_region, family_friendly, settlement_focus):
+    """Filter the cities and render one card per match."""
+    # Filter logic: start from the province's cities, then one pass for the rest
+    by_province, family, region_col = _city_indices()
+    if province_choice == "(all)":
+        rows = range(len(region_col))
+    else:
+        rows = by_province.get(province_choice, ())
+    regions = set(preferred_region)
+    filtered = [
+        i
+        for i in rows
+        if (not family_friendly or i in family)
+        and (not regions or not region_col[i] or region_col[i] in regions)
+    ]
+
+    # New filters start again from the first page of results
+    filter_key = (province_choice, tuple(sorted(regions)), family_friendly)
+    if st.session_state.get("cities_filter_key") != filter_key:
+        st.session_state["cities_filter_key"] = filter_key
+        st.session_state["cities_page"] = 0
+
+    st.markdown(
+        tr(
+            f"Showing **{len(filtered)}** city(ies) that match your filters.",
+            f"ከማጣፈጫዎችዎ ጋር ተስማሚ **{len(filtered)}** ከተሞችን እያሳየ ነው።",
+        )
+    )
+
+    if not filtered:
+        st.info(
+            tr(
+                "Try removing some filters to see more cities.",
+                "ተጨማሪ ከተሞች ለማየት አንዳንድ ማጣፈጫዎችን ያስወግዱ።",
+            )
+        )
+    else:
+        # Only render one page of cards per rerun so large datasets stay responsive
+        n_pages = (len(filtered) - 1) // CITIES_PER_PAGE + 1
+        page_idx = min(st.session_state.setdefault("cities_page", 0), n_pages - 1)
+        start = page_idx * CITIES_PER_PAGE
+        page_rows = filtered[start:start + CITIES_PER_PAGE]
+
+        # Cards are prebuilt per language; send the page as a single markdown element
+        cards = _city_cards_html(st.session_state.get("lang", "en"))
+        st.markdown("".join(cards[i] for i in page_rows), unsafe_allow_html=True)
+
+        if n_pages > 1:
+            col_prev, col_page, col_next = st.columns([1, 2, 1])
+            with col_prev:
+                st.button(
+                    tr("← Previous", "← ቀዳሚ"),
+                    disabled=page_idx == 0,
+                    on_click=_set_cities_page,
+                    args=(page_idx - 1,),
+                )
+            with col_page:
+                st.caption(
+                    tr(
+                        f"Page {page_idx + 1} of {n_pages}",
+                        f"ገጽ {page_idx + 1} ከ {n_pages}",
+                    )
+                )
+            with col_next:
+                st.button(
+                    tr("Next →", "ቀጣይ →"),
+                    disabled=page_idx >= n_pages - 1,
+                    on_click=_set_cities_page,
+                    args=(page_idx + 1,),
+                )
+
+
+def render_cities_page():
     st.subheader(tr("🏙️ Explore Cities & Provinces", "🏙️ ከተሞችን እና ክፍለ አካባቢዎችን ተመልከት"))
 
+    cities = get_cities()
     if not cities:
         st.error("No city data available. Please check `data/cities.json`.")
     else:
@@ -608,70 +922,25 @@ elif page_code == "cities":
             )
 
         with col_cards:
-            # Filter logic
-            filtered = cities
-            if province_choice != "(all)":
-                filtered = [c for c in filtered if c.get("province") == province_choice]
-
-            if preferred_region:
-                filtered = [
-                    c
-                    for c in filtered
-                    if c.get("region_label") in preferred_region or not c.get("region_label")
-                ]
+            render_city_cards(province_choice, preferred_region, family_friendly, settlement_focus)
 
-            if family_friendly:
-                filtered = [c for c in filtered if c.get("family_friendly", False)]
-
-            st.markdown(
-                tr(
-                    f"Showing **{len(filtered)}** city(ies) that match your filters.",
-                    f"ከማጣፈጫዎችዎ ጋር ተስማሚ **{len(filtered)}** ከተሞችን እያሳየ ነው።",
-                )
-            )
-
-            if not filtered:
-                st.info(
-                    tr(
-                        "Try removing some filters to see more cities.",
-                        "ተጨማሪ ከተሞች ለማየት አንዳንድ ማጣፈጫዎችን ያስወግዱ።",
-                    )
-                )
-            else:
-                for city in filtered:
-                    name = translate_dynamic(city, "name") or city.get("name")
-                    prov = city.get("province")
-                    region_label = translate_dynamic(city, "region_label")
-                    summary = translate_dynamic(city, "summary")
-                    newcomers = translate_dynamic(city, "newcomer_support")
-                    key_sectors = city.get("key_sectors", [])
-                    cost_level = city.get("cost_of_living", "Unknown")
-                    transit = city.get("transit", "Unknown")
-
-                    st.markdown(
-                        f"""
-                        <div class="mc-card">
-                            <h3 style="margin-bottom:0.1rem;">{name}, {prov}</h3>
-                            <p class="mc-muted" style="margin-top:0.1rem;">{region_label}</p>
-                            <p style="margin-top:0.4rem;">{summary}</p>
-                            <p><strong>{tr("Newcomer services:", "የአዲስ መጡ አገልግሎቶች፦")}</strong> {newcomers}</p>
-                            <p>
-                                <strong>{tr("Cost of living:", "የኑሮ ወጪ፦")}</strong> {cost_level} &nbsp; • &nbsp;
-                                <strong>{tr("Transit:", "ትራንስፖርት፦")}</strong> {transit}
-                            </p>
-                            <p>
-                                {"".join(f'<span class="mc-pill">{sec}</span>' for sec in key_sectors)}
-                            </p>
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
-                    )
 
 # =========================================================
 # Page 3 – Open a Bank Account
 # =========================================================
 
-elif page_code == "bank":
+_BANKS = ("RBC", "TD Bank", "Scotiabank", "CIBC", "BMO Bank of Montreal")
+
+_BANK_LINKS = (
+    ("RBC – Newcomers to Canada", "https://www.rbc.com/newcomers"),
+    ("TD – New to Canada Banking", "https://www.td.com/ca/en/personal-banking/solutions/new-to-canada"),
+    ("Scotiabank – StartRight® Program", "https://www.scotiabank.com/ca/en/personal/bank/bank-accounts/newcomers.html"),
+    ("CIBC – Newcomer Banking", "https://www.cibc.com/en/personal-banking/newcomers.html"),
+    ("BMO – NewStart® Program", "https://www.bmo.com/main/personal/bank-accounts/newcomers-to-canada"),
+)
+
+
+def render_bank_page():
     st.subheader(tr("🏦 Open a Bank Account in Canada", "🏦 በካናዳ ውስጥ የባንክ መለያ መክፈት"))
 
     if lang_code == "am":
@@ -697,16 +966,12 @@ elif page_code == "bank":
         placeholder=tr("e.g., Toronto, ON or M5V 2T6", "ለምሳሌ፡ Toronto, ON ወይም M5V 2T6"),
     )
 
-    st.markdown(
-        tr(
-            "### 1. Key steps to open a basic chequing account",
-            "### 1፡ መሰረታዊ የቻክ መለያ ለመክፈት ዋና እርምጃዎች",
-        )
-    )
-
+    # Heading and steps go out as one markdown block
     if lang_code == "am":
         st.markdown(
             """
+            ### 1፡ መሰረታዊ የቻክ መለያ ለመክፈት ዋና እርምጃዎች
+
             1. **ባንክ እና የመለያ አይነት ይምረጡ** (የአዲስ መጡ መለያ፣ የተማሪ መለያ ወዘተ)  
             2. **የመለያ ሰነዶችዎን ያዘጋጁ** (ብዙውን ጊዜ 2 መለያ ያስፈልጋል):  
                - ፓስፖርት  
@@ -722,6 +987,8 @@ elif page_code == "bank":
     else:
         st.markdown(
             """
+            ### 1. Key steps to open a basic chequing account
+
             1. **Choose a bank and account type** (e.g., newcomer chequing account, student account).  
             2. **Prepare your documents** (usually 2 pieces of ID):  
                - Passport  
@@ -752,16 +1019,7 @@ elif page_code == "bank":
             "free international transfers, or cash bonuses. Always check the latest details on their websites."
         )
 
-    bank_links = {
-        "RBC – Newcomers to Canada": "https://www.rbc.com/newcomers",
-        "TD – New to Canada Banking": "https://www.td.com/ca/en/personal-banking/solutions/new-to-canada",
-        "Scotiabank – StartRight® Program": "https://www.scotiabank.com/ca/en/personal/bank/bank-accounts/newcomers.html",
-        "CIBC – Newcomer Banking": "https://www.cibc.com/en/personal-banking/newcomers.html",
-        "BMO – NewStart® Program": "https://www.bmo.com/main/personal/bank-accounts/newcomers-to-canada",
-    }
-
-    for label, url in bank_links.items():
-        st.markdown(f"- [{label}]({url})")
+    st.markdown("\n".join(f"- [{label}]({url})" for label, url in _BANK_LINKS))
 
     st.markdown(tr("### 3. Find branches near you", "### 3. ቅርብ ያሉ የባንክ ቅርንጫፎችን ያግኙ"))
 
@@ -771,12 +1029,12 @@ elif page_code == "bank":
         else:
             st.success("Here are quick links to find branches close to you on Google Maps:")
 
-        banks = ["RBC", "TD Bank", "Scotiabank", "CIBC", "BMO Bank of Montreal"]
-
-        for b in banks:
-            query = f"{b} near {location}"
-            url = maps_search_url(query)
-            st.markdown(f"- [{b} near {location}]({url})")
+        st.markdown(
+            "\n".join(
+                f"- [{b} near {location}]({maps_search_url(f'{b} near {location}')})"
+                for b in _BANKS
+            )
+        )
 
         st.caption(
             tr(
@@ -792,11 +1050,23 @@ elif page_code == "bank":
             )
         )
 
+
 # =========================================================
 # Page 4 – Housing Search
 # =========================================================
 
-elif page_code == "housing":
+# "search" is the English term used in the external rental searches
+_ACCOM_OPTIONS = (
+    {"search": "apartment", "label_en": "Any", "label_am": "ማንኛውም"},
+    {"search": "Room in shared house", "label_en": "Room in shared house", "label_am": "በተካፋይ ቤት ውስጥ ክፍል"},
+    {"search": "Bachelor / studio", "label_en": "Bachelor / studio", "label_am": "ባችለር / ስቱዲዮ"},
+    {"search": "1-bedroom apartment", "label_en": "1-bedroom apartment", "label_am": "1 መኝታ አፓርታማ"},
+    {"search": "2-bedroom apartment", "label_en": "2-bedroom apartment", "label_am": "2 መኝታ አፓርታማ"},
+    {"search": "Family-size house / townhouse", "label_en": "Family-size house / townhouse", "label_am": "ለቤተሰብ አይነት ቤት / ታውንሃውስ"},
+)
+
+
+def render_housing_page():
     st.subheader(tr("🏡 Rental Housing for Newcomers", "🏡 ለአዲስ መጡ ሰዎች የኪራይ ቤት መፈለጊያ"))
 
     if lang_code == "am":
@@ -819,25 +1089,20 @@ elif page_code == "housing":
         value=1800,
         step=50,
     )
-    accom_type = st.selectbox(
+    label_key = "label_am" if lang_code == "am" else "label_en"
+    accom_labels = [opt[label_key] for opt in _ACCOM_OPTIONS]
+    accom_index = st.selectbox(
         tr("Type of accommodation", "የቤት አይነት"),
-        [
-            tr("Any", "ማንኛውም"),
-            tr("Room in shared house", "በተካፋይ ቤት ውስጥ ክፍል"),
-            tr("Bachelor / studio", "ባችለር / ስቱዲዮ"),
-            tr("1-bedroom apartment", "1 መኝታ አፓርታማ"),
-            tr("2-bedroom apartment", "2 መኝታ አፓርታማ"),
-            tr("Family-size house / townhouse", "ለቤተሰብ አይነት ቤት / ታውንሃውስ"),
-        ],
+        options=list(range(len(accom_labels))),
+        format_func=accom_labels.__getitem__,
     )
 
-    if city.strip():
+    city_q = city.strip()
+    if city_q:
         st.markdown(tr("### 1. Search rental listings (trusted platforms)", "### 1. የኪራይ ቤቶች ማግኘት (ታማኝ መስኮቶች)"))
 
-        city_q = city.strip()
         # Use a simple English search phrase for external sites
-        accom_search = "Any" if "ማንኛውም" in accom_type else accom_type
-        search_phrase = f"rent {accom_search} {city_q}" if "Any" not in accom_search else f"rent apartment {city_q}"
+        search_phrase = f"rent {_ACCOM_OPTIONS[accom_index]['search']} {city_q}"
 
         links = {
             "Rentals.ca": google_search_url(f"site:rentals.ca {search_phrase}"),
@@ -847,8 +1112,12 @@ elif page_code == "housing":
             "PadMapper / Zumper / Others": google_search_url(f"rentals {city_q} apartments"),
         }
 
-        for label, url in links.items():
-            st.markdown(f"- [{label} – search for **{city_q}**]({url})")
+        st.markdown(
+            "\n".join(
+                f"- [{label} – search for **{city_q}**]({url})"
+                for label, url in links.items()
+            )
+        )
 
         st.markdown(tr("### 2. Neighbourhood & rent guidance (approximate)", "### 2. ማህበረሰብ እና የኪራይ መጠን (በግምት)"))
 
@@ -910,11 +1179,12 @@ elif page_code == "housing":
             )
         )
 
+
 # =========================================================
 # Page 5 – Employment Services
 # =========================================================
 
-elif page_code == "employment":
+def render_employment_page():
     st.subheader(tr("💼 Find Jobs & Employment Support", "💼 ስራ እና የስራ ድጋፍ ፈልግ"))
 
     if lang_code == "am":
@@ -939,25 +1209,19 @@ elif page_code == "employment":
         placeholder=tr("e.g., Toronto, ON or Calgary, AB", "ለምሳሌ፡ Toronto, ON ወይም Calgary, AB"),
     )
 
-    if job_title.strip() and job_city.strip():
-        q_job = job_title.strip()
-        q_city = job_city.strip()
+    q_job = job_title.strip()
+    q_city = job_city.strip()
+    if q_job and q_city:
 
         st.markdown(tr("### 1. Job postings on trusted Canadian platforms", "### 1. በታማኝ የካናዳ መድረኮች ላይ ስራ ፍለጋ"))
 
-        indeed_url = f"https://ca.indeed.com/jobs?q={quote_plus(q_job)}&l={quote_plus(q_city)}"
-        jobbank_url = (
-            "https://www.jobbank.gc.ca/jobsearch/jobsearch?"
-            f"searchstring={quote_plus(q_job)}&locationstring={quote_plus(q_city)}"
-        )
-        linkedin_url = (
-            "https://www.linkedin.com/jobs/search/?"
-            f"keywords={quote_plus(q_job)}&location={quote_plus(q_city)}"
-        )
+        indeed_url, jobbank_url, linkedin_url = job_search_urls(q_job, q_city)
 
-        st.markdown(f"- [Indeed – {q_job} in {q_city}]({indeed_url})")
-        st.markdown(f"- [Job Bank – {q_job} in {q_city}]({jobbank_url})")
-        st.markdown(f"- [LinkedIn Jobs – {q_job} in {q_city}]({linkedin_url})")
+        st.markdown(
+            f"- [Indeed – {q_job} in {q_city}]({indeed_url})\n"
+            f"- [Job Bank – {q_job} in {q_city}]({jobbank_url})\n"
+            f"- [LinkedIn Jobs – {q_job} in {q_city}]({linkedin_url})"
+        )
 
         st.markdown(tr("### 2. Match & relevance (how to judge a good posting)", "### 2. ስራው እንደሚመስል መገመት"))
 
@@ -996,10 +1260,9 @@ elif page_code == "employment":
             )
         )
 
-        st.markdown(tr("### 4. Resume & interview tips (tailored to your role)", "### 4. ለሪዙሜ እና ለቃለ መጠይቅ ምክሮች"))
-
         if lang_code == "am":
             st.write(
+                "### 4. ለሪዙሜ እና ለቃለ መጠይቅ ምክሮች\n\n"
                 f"ለ **{q_job}** የሚመሩ ስራዎች፦\n"
                 "- ከስራ ልምድዎ ጋር ተመሳሳይ የሆኑ ተግባራትን በግልፅ ያመልክቱ\n"
                 "- አንድ ወይም ሁለት ገጽ ያለው የካናዳ ዓይነት ሪዙሜ ይጠቀሙ\n"
@@ -1008,6 +1271,7 @@ elif page_code == "employment":
             )
         else:
             st.write(
+                "### 4. Resume & interview tips (tailored to your role)\n\n"
                 f"For **{q_job}** roles, try to:\n"
                 "- Highlight your most recent **work experience** that matches the job duties\n"
                 "- Use **Canadian-style resume format** (1–2 pages, no photo, clear bullet points)\n"
@@ -1025,38 +1289,40 @@ elif page_code == "employment":
             )
         )
 
+
 # =========================================================
 # Page 6 – Places of Worship (improved, language/country specific)
 # =========================================================
 
-elif page_code == "worship":
-    st.subheader(tr("🛕 Find a Place of Worship or Spiritual Community", "🛕 የመሰገና ቤት ወይም መንፈሳዊ ማህበር ፈልግ"))
+# "keyword" is the place type used in the Google Maps search
+_WORSHIP_OPTIONS = (
+    {"code": "christian", "keyword": "church", "label_en": "Christian church", "label_am": "የክርስቲያን ቤተክርስቲያን"},
+    {"code": "muslim", "keyword": "mosque", "label_en": "Muslim mosque", "label_am": "የሙስሊም መስጊድ"},
+    {"code": "jewish", "keyword": "synagogue", "label_en": "Jewish synagogue", "label_am": "የይሁዳውያን ሲናጎግ"},
+    {"code": "hindu", "keyword": "hindu temple", "label_en": "Hindu temple", "label_am": "የሂንዱ ቤተመቅደስ"},
+    {"code": "buddhist", "keyword": "buddhist temple", "label_en": "Buddhist temple", "label_am": "የቡዲስት ቤተመቅደስ"},
+    {"code": "sikh", "keyword": "gurdwara", "label_en": "Sikh gurdwara", "label_am": "የሲክ ጉርድዋራ"},
+    {"code": "other", "keyword": "spiritual centre", "label_en": "Other / interfaith centre", "label_am": "ሌላ / የተዋሃደ እምነት ማዕከል"},
+)
 
-    worship_options = [
-        {"code": "christian", "label_en": "Christian church", "label_am": "የክርስቲያን ቤተክርስቲያን"},
-        {"code": "muslim", "label_en": "Muslim mosque", "label_am": "የሙስሊም መስጊድ"},
-        {"code": "jewish", "label_en": "Jewish synagogue", "label_am": "የይሁዳውያን ሲናጎግ"},
-        {"code": "hindu", "label_en": "Hindu temple", "label_am": "የሂንዱ ቤተመቅደስ"},
-        {"code": "buddhist", "label_en": "Buddhist temple", "label_am": "የቡዲስት ቤተመቅደስ"},
-        {"code": "sikh", "label_en": "Sikh gurdwara", "label_am": "የሲክ ጉርድዋራ"},
-        {"code": "other", "label_en": "Other / interfaith centre", "label_am": "ሌላ / የተዋሃደ እምነት ማዕከል"},
-    ]
 
-    def worship_label(opt):
-        return opt["label_am"] if lang_code == "am" else opt["label_en"]
+def render_worship_page():
+    st.subheader(tr("🛕 Find a Place of Worship or Spiritual Community", "🛕 የመሰገና ቤት ወይም መንፈሳዊ ማህበር ፈልግ"))
+
+    label_key = "label_am" if lang_code == "am" else "label_en"
+    worship_labels = [opt[label_key] for opt in _WORSHIP_OPTIONS]
 
     worship_choice_index = st.selectbox(
         tr("What type of worship place are you looking for?", "የእምነት ቤት ዓይነት ምንድን ነው የሚፈልጉት?"),
-        options=list(range(len(worship_options))),
-        format_func=lambda i: worship_label(worship_options[i]),
+        options=list(range(len(worship_labels))),
+        format_func=worship_labels.__getitem__,
     )
-    worship_choice = worship_options[worship_choice_index]
-    worship_code = worship_choice["code"]
+    worship_choice = _WORSHIP_OPTIONS[worship_choice_index]
 
     worship_city = st.text_input(
         tr("Your city or postal code", "ከተማዎ ወይም ፖስታ ኮድዎ"),
         placeholder=tr("e.g., Winnipeg, MB or H3Z 2Y7", "ለምሳሌ፡ Winnipeg, MB ወይም H3Z 2Y7"),
-    )
+    ).strip()
 
     preferred_worship_lang = st.text_input(
         tr(
@@ -1067,27 +1333,16 @@ elif page_code == "worship":
             "e.g., Amharic, Arabic, Ethiopian, Filipino",
             "ለምሳሌ፡ Amharic, Arabic, Ethiopian, Filipino",
         ),
-    )
+    ).strip()
 
-    if worship_city.strip():
-        # Internal keywords for Google Maps (robust + specific)
-        label_map = {
-            "christian": "church",
-            "muslim": "mosque",
-            "jewish": "synagogue",
-            "hindu": "hindu temple",
-            "buddhist": "buddhist temple",
-            "sikh": "gurdwara",
-            "other": "spiritual centre",
-        }
-        place_keyword = label_map.get(worship_code, "church")
+    if worship_city:
+        place_keyword = worship_choice["keyword"]
 
         # Build richer query including language/country if provided
-        query_parts = []
-        if preferred_worship_lang.strip():
-            query_parts.append(preferred_worship_lang.strip())
-        query_parts.append(place_keyword)
-        query = " ".join(query_parts) + f" near {worship_city.strip()}"
+        if preferred_worship_lang:
+            query = f"{preferred_worship_lang} {place_keyword} near {worship_city}"
+        else:
+            query = f"{place_keyword} near {worship_city}"
 
         url = maps_search_url(query)
 
@@ -1117,11 +1372,12 @@ elif page_code == "worship":
             )
         )
 
+
 # =========================================================
 # Page 7 – Food & Cultural Community Support
 # =========================================================
 
-elif page_code == "food":
+def render_food_page():
     st.subheader(tr("🥘 Find Your Food, Culture & Community", "🥘 ምግብዎን፣ ባህልዎንና ማህበረሰብዎን ፈልጉ"))
 
     origin_country = st.text_input(
@@ -1139,23 +1395,24 @@ elif page_code == "food":
         placeholder=tr("e.g., Surrey, BC or M1P 4P5", "ለምሳሌ፡ Surrey, BC ወይም M1P 4P5"),
     )
 
-    if origin_country.strip() and food_city.strip():
-        o = origin_country.strip()
-        c = food_city.strip()
-
-        st.markdown(tr("### 1. Grocery stores with your traditional foods", "### 1. የባህላዊ ምግብዎን የሚሸጡ ሱቆች"))
+    o = origin_country.strip()
+    c = food_city.strip()
+    if o and c:
 
+        # Each section (heading + its links) goes out as one markdown block
         grocery_query = f"{o} grocery store near {c}"
         grocery_url = maps_search_url(grocery_query)
-        st.markdown(f"- [{tr('Stores selling your food near', 'የምግብዎን የሚሸጡ ሱቆች ቅርብ ከ')} {c}]({grocery_url})")
-
-        st.markdown(tr("### 2. Cultural associations & community groups", "### 2. የባህል ማህበሮችና ማህበረሰብ ቡድኖች"))
+        st.markdown(
+            tr("### 1. Grocery stores with your traditional foods", "### 1. የባህላዊ ምግብዎን የሚሸጡ ሱቆች")
+            + f"\n\n- [{tr('Stores selling your food near', 'የምግብዎን የሚሸጡ ሱቆች ቅርብ ከ')} {c}]({grocery_url})"
+        )
 
         assoc_query = f"{o} community association near {c}"
         assoc_url = google_search_url(assoc_query)
-        st.markdown(f"- [{tr('Cultural associations and community groups', 'የባህል ማህበሮችና ማህበረሰብ ቡድኖች')}]({assoc_url})")
-
-        st.markdown(tr("### 3. Restaurants, cafés, and local events", "### 3. ረስቶራንቶች፣ ካፌዎችና የባህል በዓላት"))
+        st.markdown(
+            tr("### 2. Cultural associations & community groups", "### 2. የባህል ማህበሮችና ማህበረሰብ ቡድኖች")
+            + f"\n\n- [{tr('Cultural associations and community groups', 'የባህል ማህበሮችና ማህበረሰብ ቡድኖች')}]({assoc_url})"
+        )
 
         rest_query = f"{o} restaurant near {c}"
         rest_url = maps_search_url(rest_query)
@@ -1163,9 +1420,10 @@ elif page_code == "food":
         events_url = google_search_url(events_query)
 
         st.markdown(
-            f"- [{tr('Restaurants & cafés serving your food near', 'የምግብዎን የሚያቀርቡ ረስቶራንቶችና ካፌዎች ቅርብ ከ')} {c}]({rest_url})"
+            tr("### 3. Restaurants, cafés, and local events", "### 3. ረስቶራንቶች፣ ካፌዎችና የባህል በዓላት")
+            + f"\n\n- [{tr('Restaurants & cafés serving your food near', 'የምግብዎን የሚያቀርቡ ረስቶራንቶችና ካፌዎች ቅርብ ከ')} {c}]({rest_url})"
+            + f"\n- [{tr('Local cultural events and festivals', 'የባህል በዓላትና በከተማዊ እንቅስቃሴዎች')}]({events_url})"
         )
-        st.markdown(f"- [{tr('Local cultural events and festivals', 'የባህል በዓላትና በከተማዊ እንቅስቃሴዎች')}]({events_url})")
 
         st.caption(
             tr(
@@ -1188,17 +1446,19 @@ elif page_code == "food":
             )
         )
 
+
 # =========================================================
 # Page 8 – Immigration Guides
 # =========================================================
 
-elif page_code == "guides":
+def render_guides_page():
     st.subheader(tr("📚 Immigration & Settlement Guides", "📚 የመግቢያ እና የመቀመጫ መመሪያዎች"))
 
+    guides = get_guides()
     if not guides:
         st.error("No guide data available. Please check `data/immigration_guides.json`.")
     else:
-        topics = [g.get("topic") for g in guides]
+        _, topics = _guide_index()
         topic_choice = st.selectbox(tr("Select a topic", "ርዕስ ይምረጡ"), topics)
 
         guide = get_guide_by_topic(topic_choice)
@@ -1231,11 +1491,12 @@ elif page_code == "guides":
                 )
             )
 
+
 # =========================================================
 # Page 9 – About
 # =========================================================
 
-elif page_code == "about":
+def render_about_page():
     st.subheader(tr("ℹ️ About MyCanada – Newcomer AI Assistant", "ℹ️ ስለ MyCanada – ለአዲስ መጡ የኤይአይ አጋዥ"))
 
     if lang_code == "am":
@@ -1276,3 +1537,22 @@ elif page_code == "about":
             It does **not** provide legal, immigration, or financial advice.
             """
         )
+
+
+# =========================================================
+# Page dispatch – only the selected page's renderer runs
+# =========================================================
+
+PAGE_RENDERERS = {
+    "assistant": render_assistant_page,
+    "cities": render_cities_page,
+    "bank": render_bank_page,
+    "housing": render_housing_page,
+    "employment": render_employment_page,
+    "worship": render_worship_page,
+    "food": render_food_page,
+    "guides": render_guides_page,
+    "about": render_about_page,
+}
+
+PAGE_RENDERERS[page_code]()
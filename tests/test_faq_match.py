@@ -0,0 +1,74 @@
+"""
+Regression tests for the FAQ matcher in app.py.
+
+app.py is a Streamlit script, so it is executed once with runpy (Streamlit
+"bare mode") and the matcher is pointed at a small fixed FAQ list.
+"""
+import runpy
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+APP_PATH = Path(__file__).resolve().parents[1] / "app.py"
+
+FAQS = [
+    {"question": "How do I open a bank account?", "answer": "bank"},
+    {"question": "Do I need a job offer for Express Entry?", "answer": "express entry"},
+    {"question": "How do I apply for a study permit?", "answer": "study permit"},
+    {"question": "What's a work-permit?", "answer": "work permit"},
+]
+
+BACKENDS = ["rapidfuzz", "difflib"]
+
+
+@pytest.fixture(scope="module")
+def app_globals():
+    namespace = runpy.run_path(str(APP_PATH))
+    # The functions share the script's real globals (run_path returns a copy)
+    app = namespace["best_faq_match"].__globals__
+    app["get_faqs"] = lambda: FAQS
+    return app
+
+
+@pytest.fixture(params=BACKENDS)
+def best_faq_match(request, app_globals, monkeypatch):
+    if request.param == "rapidfuzz":
+        pytest.importorskip("rapidfuzz")
+        monkeypatch.setitem(app_globals, "RAPIDFUZZ_AVAILABLE", True)
+    else:
+        monkeypatch.setitem(app_globals, "RAPIDFUZZ_AVAILABLE", False)
+    for name in ("_faq_lookup", "_faq_index", "_tfidf_index", "_best_faq_index"):
+        app_globals[name].clear()
+    return app_globals["best_faq_match"]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "i like pizza",
+        "how to get a sin number",
+        "permit",
+    ],
+)
+def test_stopword_or_single_word_overlap_does_not_match(best_faq_match, query):
+    faq, score = best_faq_match(query)
+    assert faq is None, (query, faq, score)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("How do I apply for a study permit?", "study permit"),
+        ("how do i apply for study permit", "study permit"),
+        ("apply study permit", "study permit"),
+        ("express entry job offer", "express entry"),
+        ("what's a work permit", "work permit"),
+        ("work-permit", "work permit"),
+    ],
+)
+def test_related_questions_match(best_faq_match, query, expected):
+    faq, score = best_faq_match(query)
+    assert faq is not None, (query, score)
+    assert faq["answer"] == expected